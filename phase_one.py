@@ -1,88 +1,539 @@
-from dataclasses import dataclass
+from collections import deque
 from typing import List, Dict, Optional
+import asyncio
+import hashlib
 import os
+import random
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import logging
 
+import httpx
+import numpy as np
+import orjson
+from aiolimiter import AsyncLimiter
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
 class Position:
-    row: int
-    column: int
+    # Slotted to skip per-instance __dict__ allocation; large goal maps
+    # create one of these per cell.
+    __slots__ = ("row", "column")
+
+    def __init__(self, row: int, column: int):
+        self.row = row
+        self.column = column
+
+    def __repr__(self) -> str:
+        return f"Position(row={self.row}, column={self.column})"
 
     def to_dict(self) -> Dict:
         return {"row": self.row, "column": self.column}
 
 
 class AstralObject:
+    ENDPOINT = ""
+    __slots__ = ("position", "_params")
+
     def __init__(self, position: Position):
         self.position = position
+        self._params: Optional[Dict] = None
 
-    def to_api_params(self) -> Dict:
+    def _build_params(self) -> Dict:
         return self.position.to_dict()
 
+    def to_api_params(self) -> Dict:
+        """Return the API payload, built once and reused across sends."""
+        if self._params is None:
+            self._params = self._build_params()
+        return self._params
+
 
 class Polyanet(AstralObject):
-    pass
+    ENDPOINT = "/polyanets"
+    __slots__ = ()
+
+
+def _idempotency_key(method: str, endpoint: str, body: bytes) -> str:
+    """Derive a stable key for a logical operation.
+
+    Keys depend only on the method, endpoint and serialized body, so
+    every retry of the same request carries the same key and the server
+    can dedupe replays, while a POST and a DELETE to the same endpoint
+    never collide.
+    """
+    return hashlib.sha1(f"{method}|{endpoint}|".encode() + body).hexdigest()
+
+
+# Upper bound on any header-derived pause; a malformed or epoch-valued
+# header must never stall the client indefinitely.
+_MAX_RATE_LIMIT_PAUSE = 10.0
+
+
+def _rate_limit_pause(headers) -> float:
+    """Derive a pause in seconds from rate-limit response headers.
+
+    Honors Retry-After, and X-RateLimit-Reset when X-RateLimit-Remaining
+    is nearly exhausted. Reset values that look like epoch timestamps are
+    converted to a delta, and the result is clamped to
+    _MAX_RATE_LIMIT_PAUSE. Returns 0.0 when no pause is needed.
+    """
+    pause = 0.0
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            pause = float(retry_after)
+        except ValueError:
+            pass
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is not None and reset is not None:
+        try:
+            if int(remaining) <= 2:
+                reset_seconds = float(reset)
+                # Some servers send the reset as an epoch timestamp.
+                if reset_seconds > 1e6:
+                    reset_seconds -= time.time()
+                pause = max(pause, reset_seconds)
+        except ValueError:
+            pass
+    return min(max(pause, 0.0), _MAX_RATE_LIMIT_PAUSE)
+
+
+class RetryQuota:
+    """Token bucket that caps retry spend across the client.
+
+    Each retry costs retry_cost tokens and each first-try success refunds
+    one, so retries stay cheap while the server is healthy and dry up
+    during sustained failure instead of amplifying load.
+    """
+
+    def __init__(self, capacity: float = 50.0, retry_cost: float = 5.0):
+        self.capacity = capacity
+        self.retry_cost = retry_cost
+        self._tokens = capacity
+
+    def acquire(self) -> bool:
+        """Spend tokens for one retry; False means fail fast instead."""
+        if self._tokens < self.retry_cost:
+            return False
+        self._tokens -= self.retry_cost
+        return True
+
+    def refund(self) -> None:
+        """Return a token after a successful request."""
+        self._tokens = min(self.capacity, self._tokens + 1.0)
+
+
+class RetryController:
+    """Circuit breaker that disables retries during failure storms.
+
+    Tracks per-attempt outcomes over a sliding window; once the rejection
+    rate exceeds threshold, retries are globally disabled for cooldown
+    seconds. After the cooldown a single probe retry is admitted, and its
+    outcome decides whether retries resume or stay disabled.
+    """
+
+    def __init__(
+        self,
+        window: float = 30.0,
+        threshold: float = 0.3,
+        cooldown: float = 30.0,
+        min_samples: int = 10,
+    ):
+        self.window = window
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.min_samples = min_samples
+        self.disable_until = 0.0
+        self._outcomes = deque()
+        self._probing = False
+        self._admitted_probe = False
+
+    def _trim(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] >= self.window:
+            self._outcomes.popleft()
+
+    def measure_value(self) -> float:
+        """Rejection rate over the sliding window."""
+        self._trim(time.monotonic())
+        if not self._outcomes:
+            return 0.0
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        return failures / len(self._outcomes)
+
+    def record(self, ok: bool, probe: bool = False) -> None:
+        """Record one attempt outcome and update breaker state.
+
+        Only the outcome flagged as the post-cooldown probe resolves the
+        breaker, and the window cannot open it until min_samples outcomes
+        have been seen, so a cold start never trips on its first failure.
+        """
+        now = time.monotonic()
+        self._outcomes.append((now, ok))
+        self._trim(now)
+        if probe:
+            self._probing = False
+            if ok:
+                self.disable_until = 0.0
+            else:
+                self.disable_until = now + self.cooldown
+            return
+        if (
+            len(self._outcomes) >= self.min_samples
+            and self.measure_value() > self.threshold
+        ):
+            self.disable_until = now + self.cooldown
+
+    def allow_retry(self) -> bool:
+        """Whether a retry may be attempted right now.
+
+        When the cooldown has elapsed a single caller is admitted as the
+        probe; it must check probe_admitted immediately and report that
+        attempt via record(..., probe=True).
+        """
+        now = time.monotonic()
+        self._admitted_probe = False
+        if now < self.disable_until:
+            return False
+        if self.disable_until:
+            if self._probing:
+                return False
+            # Cooldown elapsed: admit a single probe retry.
+            self._probing = True
+            self._admitted_probe = True
+        return True
+
+    @property
+    def probe_admitted(self) -> bool:
+        """Whether the last allow_retry() admission was the probe."""
+        return self._admitted_probe
+
+    def cancel_probe(self) -> None:
+        """Release the probe slot when the admitted retry never ran."""
+        if self._admitted_probe:
+            self._probing = False
+            self._admitted_probe = False
 
 
 class MegaverseAPI:
-    def __init__(self, base_url: str, candidate_id: str):
+    def __init__(self, base_url: str, candidate_id: str, rpm_limit: int = 100):
         """Initialize the Megaverse API client."""
         self.base_url = base_url.rstrip("/")
         self.candidate_id = candidate_id
         self.session = requests.Session()
+        # Pool a single warm keep-alive connection so repeated calls skip
+        # the TCP+TLS handshake, which dominates small JSON POSTs.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=64, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {"Connection": "keep-alive", "Content-Type": "application/json"}
+        )
+        self.rpm_limit = rpm_limit
+        self.retry_quota = RetryQuota()
+        self.retry_controller = RetryController()
+        self._pause_until = 0.0
+        self._request_times = deque()
+
+    def wait_if_throttled(self) -> None:
+        """Block until the server's rate budget allows another request."""
+        now = time.monotonic()
+        if self._pause_until > now:
+            time.sleep(self._pause_until - now)
+        while True:
+            now = time.monotonic()
+            # Slide a 60s window of request timestamps.
+            while self._request_times and now - self._request_times[0] >= 60:
+                self._request_times.popleft()
+            if len(self._request_times) < self.rpm_limit:
+                break
+            time.sleep(self._request_times[0] + 60 - now)
+        self._request_times.append(time.monotonic())
+
+    def _note_rate_limits(self, headers) -> None:
+        """Feed rate-limit response headers into the reactive pause."""
+        pause = _rate_limit_pause(headers)
+        if pause:
+            self._pause_until = max(self._pause_until, time.monotonic() + pause)
+
+    def _prepare_body(self, data: Dict) -> bytes:
+        """Merge candidateId and preserialize the request body once."""
+        return orjson.dumps({**data, "candidateId": self.candidate_id})
 
     def _make_request(
         self,
         endpoint: str,
         method: str,
-        data: Dict,
+        body: Optional[bytes] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
     ) -> bool:
-        """Make an API request with retry logic."""
+        """Make an API request with retry logic.
+
+        Bodies arrive preserialized from _prepare_body, so retries reuse
+        the same immutable bytes instead of re-encoding per attempt.
+        """
         url = f"{self.base_url}{endpoint}"
-        data["candidateId"] = self.candidate_id
+        # Same key on every attempt so the server can dedupe retried POSTs.
+        headers = None
+        if body is not None:
+            headers = {"Idempotency-Key": _idempotency_key(method, endpoint, body)}
 
+        is_probe = False
         for attempt in range(max_retries):
             try:
+                self.wait_if_throttled()
                 response = self.session.request(
-                    method=method, url=url, json=data, timeout=10
+                    method=method, url=url, data=body, headers=headers, timeout=10
                 )
-                response.raise_for_status()
-                return True
             except requests.exceptions.RequestException as e:
-                logger.warning(
-                    f"Request failed (attempt {attempt + 1}/{max_retries}): {str(e)}"
-                )
+                self.retry_controller.record(False, probe=is_probe)
+                is_probe = False
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "Request failed (attempt %d/%d): %s",
+                        attempt + 1,
+                        max_retries,
+                        e,
+                    )
                 if attempt < max_retries - 1:
-                    sleep_time = retry_delay * (2**attempt)
-                    time.sleep(sleep_time)
+                    if not self._retry_allowed():
+                        break
+                    is_probe = self.retry_controller.probe_admitted
+                    time.sleep(random.uniform(0, retry_delay * (2**attempt)))
                 continue
 
+            # Branch on the status code directly; building exceptions and
+            # tracebacks per throttled response is wasted work in the hot
+            # retry loop.
+            self._note_rate_limits(response.headers)
+            if response.status_code < 400:
+                self.retry_controller.record(True, probe=is_probe)
+                if attempt == 0:
+                    self.retry_quota.refund()
+                return True
+
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Request returned %d (attempt %d/%d)",
+                    response.status_code,
+                    attempt + 1,
+                    max_retries,
+                )
+            if response.status_code != 429 and response.status_code < 500:
+                # Expected client error: the server answered, so it resolves
+                # an outstanding probe but must not feed the breaker window.
+                if is_probe:
+                    self.retry_controller.record(True, probe=True)
+                return False
+            self.retry_controller.record(False, probe=is_probe)
+            is_probe = False
+            if attempt < max_retries - 1:
+                if not self._retry_allowed():
+                    break
+                is_probe = self.retry_controller.probe_admitted
+                # Full jitter avoids synchronized retry bursts.
+                time.sleep(random.uniform(0, retry_delay * (2**attempt)))
+
         return False
 
+    def _retry_allowed(self) -> bool:
+        """Check the circuit breaker and retry quota before backing off."""
+        if not self.retry_controller.allow_retry():
+            logger.warning("Retries disabled by circuit breaker")
+            return False
+        if not self.retry_quota.acquire():
+            self.retry_controller.cancel_probe()
+            logger.warning("Retry budget exhausted, failing fast")
+            return False
+        return True
+
     def create_polyanet(self, position: Position) -> bool:
         """Create a Polyanet at the specified position."""
         return self._make_request(
-            endpoint="/polyanets", method="POST", data=position.to_dict()
+            endpoint="/polyanets",
+            method="POST",
+            body=self._prepare_body(position.to_dict()),
         )
 
     def delete_polyanet(self, position: Position) -> bool:
         """Delete a Polyanet at the specified position."""
         return self._make_request(
-            endpoint="/polyanets", method="DELETE", data=position.to_dict()
+            endpoint="/polyanets",
+            method="DELETE",
+            body=self._prepare_body(position.to_dict()),
+        )
+
+
+class AsyncMegaverseAPI:
+    def __init__(
+        self,
+        base_url: str,
+        candidate_id: str,
+        max_rate: float = 4.0,
+        concurrency: int = 8,
+    ):
+        """Initialize the async Megaverse API client.
+
+        Requests are paced by a rate limiter (max_rate requests per second,
+        kept slightly below the server's advertised limit) and capped by a
+        concurrency semaphore, so wall time scales with N / max_rate instead
+        of N x (RTT + fixed sleep).
+        """
+        self.base_url = base_url.rstrip("/")
+        self.candidate_id = candidate_id
+        self.limiter = AsyncLimiter(max_rate, 1)
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.client: Optional[httpx.AsyncClient] = None
+        self.retry_quota = RetryQuota()
+        self.retry_controller = RetryController()
+        self._pause_until = 0.0
+
+    async def _wait_if_throttled(self) -> None:
+        """Wait out any reactive pause requested by rate-limit headers."""
+        delay = self._pause_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _note_rate_limits(self, headers) -> None:
+        """Feed rate-limit response headers into the reactive pause."""
+        pause = _rate_limit_pause(headers)
+        if pause:
+            self._pause_until = max(self._pause_until, time.monotonic() + pause)
+
+    async def __aenter__(self) -> "AsyncMegaverseAPI":
+        # HTTP/2 multiplexes all in-flight requests over a few warm
+        # connections instead of opening one TCP connection per request.
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+            timeout=httpx.Timeout(10.0),
+            headers={"Content-Type": "application/json"},
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.client.aclose()
+        self.client = None
+
+    def _prepare_body(self, data: Dict) -> bytes:
+        """Merge candidateId and preserialize the request body once."""
+        return orjson.dumps({**data, "candidateId": self.candidate_id})
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        method: str,
+        body: Optional[bytes] = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ) -> bool:
+        """Make an API request with retry logic.
+
+        Bodies arrive preserialized from _prepare_body, so retries reuse
+        the same immutable bytes instead of re-encoding per attempt.
+        """
+        url = f"{self.base_url}{endpoint}"
+        # Same key on every attempt so the server can dedupe retried POSTs.
+        headers = None
+        if body is not None:
+            headers = {"Idempotency-Key": _idempotency_key(method, endpoint, body)}
+
+        is_probe = False
+        for attempt in range(max_retries):
+            try:
+                async with self.semaphore:
+                    await self._wait_if_throttled()
+                    async with self.limiter:
+                        response = await self.client.request(
+                            method=method, url=url, content=body, headers=headers
+                        )
+            except httpx.HTTPError as e:
+                self.retry_controller.record(False, probe=is_probe)
+                is_probe = False
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "Request failed (attempt %d/%d): %s",
+                        attempt + 1,
+                        max_retries,
+                        e,
+                    )
+                if attempt < max_retries - 1:
+                    if not self._retry_allowed():
+                        break
+                    is_probe = self.retry_controller.probe_admitted
+                    await asyncio.sleep(random.uniform(0, retry_delay * (2**attempt)))
+                continue
+
+            # Branch on the status code directly; building exceptions and
+            # tracebacks per throttled response is wasted work in the hot
+            # retry loop.
+            self._note_rate_limits(response.headers)
+            if response.status_code < 400:
+                self.retry_controller.record(True, probe=is_probe)
+                if attempt == 0:
+                    self.retry_quota.refund()
+                return True
+
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Request returned %d (attempt %d/%d)",
+                    response.status_code,
+                    attempt + 1,
+                    max_retries,
+                )
+            if response.status_code != 429 and response.status_code < 500:
+                # Expected client error: the server answered, so it resolves
+                # an outstanding probe but must not feed the breaker window.
+                if is_probe:
+                    self.retry_controller.record(True, probe=True)
+                return False
+            self.retry_controller.record(False, probe=is_probe)
+            is_probe = False
+            if attempt < max_retries - 1:
+                if not self._retry_allowed():
+                    break
+                is_probe = self.retry_controller.probe_admitted
+                # Full jitter avoids synchronized retry bursts.
+                await asyncio.sleep(random.uniform(0, retry_delay * (2**attempt)))
+
+        return False
+
+    def _retry_allowed(self) -> bool:
+        """Check the circuit breaker and retry quota before backing off."""
+        if not self.retry_controller.allow_retry():
+            logger.warning("Retries disabled by circuit breaker")
+            return False
+        if not self.retry_quota.acquire():
+            self.retry_controller.cancel_probe()
+            logger.warning("Retry budget exhausted, failing fast")
+            return False
+        return True
+
+    async def create_polyanet(self, position: Position) -> bool:
+        """Create a Polyanet at the specified position."""
+        return await self._make_request(
+            endpoint="/polyanets",
+            method="POST",
+            body=self._prepare_body(position.to_dict()),
+        )
+
+    async def delete_polyanet(self, position: Position) -> bool:
+        """Delete a Polyanet at the specified position."""
+        return await self._make_request(
+            endpoint="/polyanets",
+            method="DELETE",
+            body=self._prepare_body(position.to_dict()),
         )
 
 
 class MegaverseCreator:
-    def __init__(self, api: MegaverseAPI, grid_size: int):
+    def __init__(self, api: AsyncMegaverseAPI, grid_size: int):
         """Initialize the Megaverse Creator."""
         self.api = api
         self.grid_size = grid_size
@@ -95,33 +546,54 @@ class MegaverseCreator:
 
     def _generate_x_shape_positions(self) -> List[Position]:
         """Generate positions for X-shape pattern."""
+        # Create X pattern from index 2 to 8 (inclusive): main diagonal
+        # followed by counter diagonal, computed as vectorized ranges.
+        diagonal = np.arange(2, 9)
+        rows = np.concatenate([diagonal, diagonal])
+        columns = np.concatenate([diagonal, self.grid_size - 1 - diagonal])
+        return [
+            Position(row=row, column=column)
+            for row, column in zip(rows.tolist(), columns.tolist())
+        ]
+
+    async def create_x_shape(self) -> None:
+        """Create an X shape pattern of Polyanets concurrently."""
         positions = []
-
-        # Create X pattern
-        for i in range(2, 9):  # From index 2 to 8 (inclusive)
-            # Main diagonal
-            positions.append(Position(row=i, column=i))
-            # Counter diagonal
-            positions.append(Position(row=i, column=self.grid_size - 1 - i))
-
-        return positions
-
-    def create_x_shape(self) -> None:
-        """Create an X shape pattern of Polyanets."""
-        positions = self._generate_x_shape_positions()
-
-        for position in positions:
+        for position in self._generate_x_shape_positions():
             if not self._is_valid_position(position):
-                logger.warning(f"Skipping invalid position: {position}")
+                logger.warning("Skipping invalid position: %s", position)
                 continue
+            positions.append(position)
+
+        # Dispatch all creations concurrently; pacing is handled by the
+        # API client's rate limiter and semaphore.
+        results = await asyncio.gather(
+            *(self.api.create_polyanet(position) for position in positions)
+        )
 
-            if self.api.create_polyanet(position):
-                logger.info(f"Successfully created Polyanet at position {position}")
+        # Per-object successes go to DEBUG; INFO gets periodic progress and
+        # a final summary so the hot loop stays cheap at default verbosity.
+        total = len(positions)
+        created_count = 0
+        for idx, (position, created) in enumerate(zip(positions, results), start=1):
+            if created:
+                created_count += 1
+                logger.debug("Successfully created Polyanet at position %s", position)
             else:
-                logger.error(f"Failed to create Polyanet at position {position}")
+                logger.error("Failed to create Polyanet at position %s", position)
+            if idx % 50 == 0:
+                logger.info("Progress %d/%d", idx, total)
+        logger.info("Created %d/%d Polyanets", created_count, total)
 
-            # Add delay between requests to avoid rate limiting
-            time.sleep(0.5)
+
+async def run(api_base_url: str, candidate_id: str, grid_size: int) -> None:
+    """Create the X shape using the async API client."""
+    async with AsyncMegaverseAPI(api_base_url, candidate_id) as api:
+        creator = MegaverseCreator(api, grid_size)
+
+        logger.info("Starting X-shape creation...")
+        await creator.create_x_shape()
+        logger.info("X-shape creation completed!")
 
 
 def main():
@@ -136,17 +608,9 @@ def main():
         return
 
     try:
-        # Initialize API and creator
-        api = MegaverseAPI(API_BASE_URL, CANDIDATE_ID)
-        creator = MegaverseCreator(api, GRID_SIZE)
-
-        # Create X shape
-        logger.info("Starting X-shape creation...")
-        creator.create_x_shape()
-        logger.info("X-shape creation completed!")
-
+        asyncio.run(run(API_BASE_URL, CANDIDATE_ID, GRID_SIZE))
     except Exception as e:
-        logger.error(f"An error occurred: {str(e)}")
+        logger.error("An error occurred: %s", e)
 
 
 if __name__ == "__main__":
@@ -1,154 +1,881 @@
-from dataclasses import dataclass
+from collections import deque
 from typing import List, Dict, Optional
+import asyncio
+import hashlib
+import json
 import os
+import random
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import logging
 
+import httpx
+import numpy as np
+import orjson
+from aiolimiter import AsyncLimiter
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
 class Position:
-    row: int
-    column: int
+    # Slotted to skip per-instance __dict__ allocation; large goal maps
+    # create one of these per cell.
+    __slots__ = ("row", "column")
+
+    def __init__(self, row: int, column: int):
+        self.row = row
+        self.column = column
+
+    def __repr__(self) -> str:
+        return f"Position(row={self.row}, column={self.column})"
 
     def to_dict(self) -> Dict:
         return {"row": self.row, "column": self.column}
 
 
 class AstralObject:
+    ENDPOINT = ""
+    __slots__ = ("position", "_params")
+
     def __init__(self, position: Position):
         self.position = position
+        self._params: Optional[Dict] = None
 
-    def to_api_params(self) -> Dict:
+    def _build_params(self) -> Dict:
         return self.position.to_dict()
 
+    def to_api_params(self) -> Dict:
+        """Return the API payload, built once and reused across sends."""
+        if self._params is None:
+            self._params = self._build_params()
+        return self._params
+
 
 class Soloon(AstralObject):
+    ENDPOINT = "/soloons"
+    __slots__ = ("color",)
+
     def __init__(self, position: Position, color: str):
         super().__init__(position)
         self.color = color
 
-    def to_api_params(self) -> Dict:
-        params = super().to_api_params()
+    def _build_params(self) -> Dict:
+        params = super()._build_params()
         params["color"] = self.color
         return params
 
 
 class Cometh(AstralObject):
+    ENDPOINT = "/comeths"
+    __slots__ = ("direction",)
+
     def __init__(self, position: Position, direction: str):
         super().__init__(position)
         self.direction = direction
 
-    def to_api_params(self) -> Dict:
-        params = super().to_api_params()
+    def _build_params(self) -> Dict:
+        params = super()._build_params()
         params["direction"] = self.direction
         return params
 
 
 class Polyanet(AstralObject):
-    pass
+    ENDPOINT = "/polyanets"
+    __slots__ = ()
+
+
+def _idempotency_key(method: str, endpoint: str, body: bytes) -> str:
+    """Derive a stable key for a logical operation.
+
+    Keys depend only on the method, endpoint and serialized body, so
+    every retry of the same request carries the same key and the server
+    can dedupe replays, while a POST and a DELETE to the same endpoint
+    never collide.
+    """
+    return hashlib.sha1(f"{method}|{endpoint}|".encode() + body).hexdigest()
+
+
+def _goal_map_cache_path(candidate_id: str) -> str:
+    """Return the on-disk cache path for a candidate's goal map."""
+    cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "crossmint")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, f"goal-{candidate_id}.json")
+
+
+def _load_goal_map_cache(path: str) -> Optional[Dict]:
+    """Load a cached goal map entry, or None if absent or corrupt."""
+    try:
+        with open(path) as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_goal_map_cache(path: str, etag: Optional[str], goal: List[List[str]]) -> None:
+    """Persist the goal map and its ETag for conditional re-fetching."""
+    try:
+        with open(path, "w") as cache_file:
+            json.dump({"etag": etag, "goal": goal}, cache_file)
+    except OSError:
+        logger.warning("Could not write goal map cache at %s", path)
+
+
+# Upper bound on any header-derived pause; a malformed or epoch-valued
+# header must never stall the client indefinitely.
+_MAX_RATE_LIMIT_PAUSE = 10.0
+
+
+def _rate_limit_pause(headers) -> float:
+    """Derive a pause in seconds from rate-limit response headers.
+
+    Honors Retry-After, and X-RateLimit-Reset when X-RateLimit-Remaining
+    is nearly exhausted. Reset values that look like epoch timestamps are
+    converted to a delta, and the result is clamped to
+    _MAX_RATE_LIMIT_PAUSE. Returns 0.0 when no pause is needed.
+    """
+    pause = 0.0
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            pause = float(retry_after)
+        except ValueError:
+            pass
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is not None and reset is not None:
+        try:
+            if int(remaining) <= 2:
+                reset_seconds = float(reset)
+                # Some servers send the reset as an epoch timestamp.
+                if reset_seconds > 1e6:
+                    reset_seconds -= time.time()
+                pause = max(pause, reset_seconds)
+        except ValueError:
+            pass
+    return min(max(pause, 0.0), _MAX_RATE_LIMIT_PAUSE)
+
+
+class RetryQuota:
+    """Token bucket that caps retry spend across the client.
+
+    Each retry costs retry_cost tokens and each first-try success refunds
+    one, so retries stay cheap while the server is healthy and dry up
+    during sustained failure instead of amplifying load.
+    """
+
+    def __init__(self, capacity: float = 50.0, retry_cost: float = 5.0):
+        self.capacity = capacity
+        self.retry_cost = retry_cost
+        self._tokens = capacity
+
+    def acquire(self) -> bool:
+        """Spend tokens for one retry; False means fail fast instead."""
+        if self._tokens < self.retry_cost:
+            return False
+        self._tokens -= self.retry_cost
+        return True
+
+    def refund(self) -> None:
+        """Return a token after a successful request."""
+        self._tokens = min(self.capacity, self._tokens + 1.0)
+
+
+class RetryController:
+    """Circuit breaker that disables retries during failure storms.
+
+    Tracks per-attempt outcomes over a sliding window; once the rejection
+    rate exceeds threshold, retries are globally disabled for cooldown
+    seconds. After the cooldown a single probe retry is admitted, and its
+    outcome decides whether retries resume or stay disabled.
+    """
+
+    def __init__(
+        self,
+        window: float = 30.0,
+        threshold: float = 0.3,
+        cooldown: float = 30.0,
+        min_samples: int = 10,
+    ):
+        self.window = window
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.min_samples = min_samples
+        self.disable_until = 0.0
+        self._outcomes = deque()
+        self._probing = False
+        self._admitted_probe = False
+
+    def _trim(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] >= self.window:
+            self._outcomes.popleft()
+
+    def measure_value(self) -> float:
+        """Rejection rate over the sliding window."""
+        self._trim(time.monotonic())
+        if not self._outcomes:
+            return 0.0
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        return failures / len(self._outcomes)
+
+    def record(self, ok: bool, probe: bool = False) -> None:
+        """Record one attempt outcome and update breaker state.
+
+        Only the outcome flagged as the post-cooldown probe resolves the
+        breaker, and the window cannot open it until min_samples outcomes
+        have been seen, so a cold start never trips on its first failure.
+        """
+        now = time.monotonic()
+        self._outcomes.append((now, ok))
+        self._trim(now)
+        if probe:
+            self._probing = False
+            if ok:
+                self.disable_until = 0.0
+            else:
+                self.disable_until = now + self.cooldown
+            return
+        if (
+            len(self._outcomes) >= self.min_samples
+            and self.measure_value() > self.threshold
+        ):
+            self.disable_until = now + self.cooldown
+
+    def allow_retry(self) -> bool:
+        """Whether a retry may be attempted right now.
+
+        When the cooldown has elapsed a single caller is admitted as the
+        probe; it must check probe_admitted immediately and report that
+        attempt via record(..., probe=True).
+        """
+        now = time.monotonic()
+        self._admitted_probe = False
+        if now < self.disable_until:
+            return False
+        if self.disable_until:
+            if self._probing:
+                return False
+            # Cooldown elapsed: admit a single probe retry.
+            self._probing = True
+            self._admitted_probe = True
+        return True
+
+    @property
+    def probe_admitted(self) -> bool:
+        """Whether the last allow_retry() admission was the probe."""
+        return self._admitted_probe
+
+    def cancel_probe(self) -> None:
+        """Release the probe slot when the admitted retry never ran."""
+        if self._admitted_probe:
+            self._probing = False
+            self._admitted_probe = False
 
 
 class MegaverseAPI:
-    def __init__(self, base_url: str, candidate_id: str):
+    def __init__(self, base_url: str, candidate_id: str, rpm_limit: int = 100):
         self.base_url = base_url.rstrip("/")
         self.candidate_id = candidate_id
         self.session = requests.Session()
+        # Pool a single warm keep-alive connection so repeated calls skip
+        # the TCP+TLS handshake, which dominates small JSON POSTs.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=64, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {"Connection": "keep-alive", "Content-Type": "application/json"}
+        )
+        self.rpm_limit = rpm_limit
+        self.retry_quota = RetryQuota()
+        self.retry_controller = RetryController()
+        self._pause_until = 0.0
+        self._request_times = deque()
+        self._goal_map: Optional[List[List[str]]] = None
+
+    def wait_if_throttled(self) -> None:
+        """Block until the server's rate budget allows another request."""
+        now = time.monotonic()
+        if self._pause_until > now:
+            time.sleep(self._pause_until - now)
+        while True:
+            now = time.monotonic()
+            # Slide a 60s window of request timestamps.
+            while self._request_times and now - self._request_times[0] >= 60:
+                self._request_times.popleft()
+            if len(self._request_times) < self.rpm_limit:
+                break
+            time.sleep(self._request_times[0] + 60 - now)
+        self._request_times.append(time.monotonic())
+
+    def _note_rate_limits(self, headers) -> None:
+        """Feed rate-limit response headers into the reactive pause."""
+        pause = _rate_limit_pause(headers)
+        if pause:
+            self._pause_until = max(self._pause_until, time.monotonic() + pause)
+
+    def _prepare_body(self, data: Dict) -> bytes:
+        """Merge candidateId and preserialize the request body once."""
+        return orjson.dumps({**data, "candidateId": self.candidate_id})
 
     def _make_request(
         self,
         endpoint: str,
         method: str,
-        data: Dict,
+        body: Optional[bytes] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        headers: Optional[Dict] = None,
     ) -> Optional[requests.Response]:
-        """Make an API request with retry logic."""
+        """Make an API request with retry logic.
+
+        Bodies arrive preserialized from _prepare_body, so retries reuse
+        the same immutable bytes instead of re-encoding per attempt.
+        """
         url = f"{self.base_url}{endpoint}"
-        data["candidateId"] = self.candidate_id
+        req_headers = dict(headers) if headers else {}
+        # Same key on every attempt so the server can dedupe retried POSTs.
+        if body is not None:
+            req_headers["Idempotency-Key"] = _idempotency_key(method, endpoint, body)
 
+        is_probe = False
         for attempt in range(max_retries):
             try:
+                self.wait_if_throttled()
                 response = self.session.request(
-                    method=method, url=url, json=data, timeout=10
+                    method=method,
+                    url=url,
+                    data=body,
+                    headers=req_headers or None,
+                    timeout=10,
                 )
-                response.raise_for_status()
-                return response
             except requests.exceptions.RequestException as e:
-                logger.warning(
-                    f"Request failed (attempt {attempt + 1}/{max_retries}): {str(e)}"
-                )
+                self.retry_controller.record(False, probe=is_probe)
+                is_probe = False
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "Request failed (attempt %d/%d): %s",
+                        attempt + 1,
+                        max_retries,
+                        e,
+                    )
                 if attempt < max_retries - 1:
-                    sleep_time = retry_delay * (2**attempt)
-                    time.sleep(sleep_time)
+                    if not self._retry_allowed():
+                        break
+                    is_probe = self.retry_controller.probe_admitted
+                    time.sleep(random.uniform(0, retry_delay * (2**attempt)))
                 continue
 
+            # Branch on the status code directly; building exceptions and
+            # tracebacks per throttled response is wasted work in the hot
+            # retry loop.
+            self._note_rate_limits(response.headers)
+            if response.status_code < 400:
+                self.retry_controller.record(True, probe=is_probe)
+                if attempt == 0:
+                    self.retry_quota.refund()
+                return response
+
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Request returned %d (attempt %d/%d)",
+                    response.status_code,
+                    attempt + 1,
+                    max_retries,
+                )
+            if response.status_code != 429 and response.status_code < 500:
+                # Expected client error: the server answered, so it resolves
+                # an outstanding probe but must not feed the breaker window.
+                if is_probe:
+                    self.retry_controller.record(True, probe=True)
+                return None
+            self.retry_controller.record(False, probe=is_probe)
+            is_probe = False
+            if attempt < max_retries - 1:
+                if not self._retry_allowed():
+                    break
+                is_probe = self.retry_controller.probe_admitted
+                # Full jitter avoids synchronized retry bursts.
+                time.sleep(random.uniform(0, retry_delay * (2**attempt)))
+
         return None
 
+    def _retry_allowed(self) -> bool:
+        """Check the circuit breaker and retry quota before backing off."""
+        if not self.retry_controller.allow_retry():
+            logger.warning("Retries disabled by circuit breaker")
+            return False
+        if not self.retry_quota.acquire():
+            self.retry_controller.cancel_probe()
+            logger.warning("Retry budget exhausted, failing fast")
+            return False
+        return True
+
     def create_object(self, obj: AstralObject) -> bool:
-        endpoint_map = {
-            "Polyanet": "/polyanets",
-            "Soloon": "/soloons",
-            "Cometh": "/comeths",
-        }
-        endpoint = endpoint_map[obj.__class__.__name__]
         response = self._make_request(
-            endpoint=endpoint, method="POST", data=obj.to_api_params()
+            endpoint=obj.ENDPOINT,
+            method="POST",
+            body=self._prepare_body(obj.to_api_params()),
         )
         return response is not None
 
     def get_goal_map(self) -> List[List[str]]:
-        """Fetch the goal map for the candidate."""
+        """Fetch the goal map, revalidating an ETag-backed disk cache."""
+        if self._goal_map is not None:
+            return self._goal_map
+
+        cache_path = _goal_map_cache_path(self.candidate_id)
+        cached = _load_goal_map_cache(cache_path)
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
         endpoint = f"/map/{self.candidate_id}/goal"
-        response = self._make_request(endpoint=endpoint, method="GET")
-        if response and response.status_code == 200:
-            return response.json().get("goal", [])
+        response = self._make_request(endpoint=endpoint, method="GET", headers=headers)
+        if response is None:
+            logger.error("Failed to retrieve goal map.")
+            return []
+
+        if response.status_code == 304 and cached:
+            goal = cached.get("goal", [])
         else:
+            goal = response.json().get("goal", [])
+            _store_goal_map_cache(cache_path, response.headers.get("ETag"), goal)
+
+        self._goal_map = goal
+        return goal
+
+
+class Backpressure:
+    """AIMD concurrency controller, in the spirit of TCP congestion control.
+
+    Concurrency grows additively (+0.5) while EWMA latency stays under
+    latency_target and shrinks multiplicatively (x0.5) on 429s, 5xx or
+    timeouts, keeping dispatch near the knee of the latency curve instead
+    of cliff-diving under load. Used as an async context manager around
+    each in-flight request.
+    """
+
+    def __init__(
+        self,
+        initial: float = 4.0,
+        c_min: float = 1.0,
+        c_max: float = 32.0,
+        latency_target: float = 0.2,
+    ):
+        self.c = min(c_max, max(c_min, initial))
+        self.c_min = c_min
+        self.c_max = c_max
+        self.latency_target = latency_target
+        self.sem = asyncio.Semaphore(int(self.c))
+        self._ewma_latency: Optional[float] = None
+        # Permits owed to the semaphore after a multiplicative decrease;
+        # swallowed instead of released as requests complete.
+        self._deficit = 0
+
+    async def __aenter__(self) -> "Backpressure":
+        await self.sem.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._deficit > 0:
+            self._deficit -= 1
+        else:
+            self.sem.release()
+
+    def record(self, latency: float) -> None:
+        """Feed one healthy completion; additive increase on good latency."""
+        if self._ewma_latency is None:
+            self._ewma_latency = latency
+        else:
+            self._ewma_latency = 0.8 * self._ewma_latency + 0.2 * latency
+        if self._ewma_latency <= self.latency_target:
+            self._resize(self.c + 0.5)
+        else:
+            self._resize(self.c * 0.5)
+
+    def backoff(self) -> None:
+        """Multiplicative decrease after a 429, 5xx or timeout."""
+        self._resize(self.c * 0.5)
+
+    def _resize(self, new_c: float) -> None:
+        new_c = min(self.c_max, max(self.c_min, new_c))
+        target = int(new_c)
+        current = int(self.c)
+        self.c = new_c
+        if target > current:
+            for _ in range(target - current):
+                if self._deficit > 0:
+                    self._deficit -= 1
+                else:
+                    self.sem.release()
+        elif target < current:
+            self._deficit += current - target
+
+
+class BatchingClient:
+    """Coalesce same-endpoint creations into single batch requests.
+
+    Payloads submitted via submit() are buffered per endpoint and flushed as
+    one `<endpoint>/batch` array POST once max_batch_size payloads are
+    pending or batch_interval seconds have elapsed, collapsing N round-trips
+    into one. If the server rejects the batch endpoint, the batch falls back
+    to individual requests and batching is disabled for that endpoint.
+    """
+
+    def __init__(
+        self,
+        api: "AsyncMegaverseAPI",
+        max_batch_size: int = 20,
+        batch_interval: float = 0.025,
+    ):
+        self.api = api
+        self.max_batch_size = max_batch_size
+        self.batch_interval = batch_interval
+        self._pending: Dict[str, List] = {}
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
+        self._batch_unsupported = set()
+
+    async def submit(self, endpoint: str, payload: Dict) -> bool:
+        """Submit a payload, resolving once its batch (or fallback) completes."""
+        if endpoint in self._batch_unsupported:
+            result = await self.api._make_request(
+                endpoint=endpoint,
+                method="POST",
+                body=self.api._prepare_body(payload),
+            )
+            return result is not None
+
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.setdefault(endpoint, [])
+        pending.append((payload, future))
+
+        if len(pending) >= self.max_batch_size:
+            await self._flush(endpoint)
+        elif endpoint not in self._flush_tasks:
+            self._flush_tasks[endpoint] = asyncio.create_task(
+                self._flush_later(endpoint)
+            )
+
+        return await future
+
+    async def _flush_later(self, endpoint: str) -> None:
+        await asyncio.sleep(self.batch_interval)
+        await self._flush(endpoint)
+
+    async def _flush(self, endpoint: str) -> None:
+        batch = self._pending.pop(endpoint, [])
+        task = self._flush_tasks.pop(endpoint, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        if not batch:
+            return
+
+        payloads = [payload for payload, _ in batch]
+        result = await self.api._make_request(
+            endpoint=f"{endpoint}/batch",
+            method="POST",
+            body=self.api._prepare_body({"items": payloads}),
+        )
+        if result is not None:
+            for _, future in batch:
+                future.set_result(True)
+            return
+
+        # Batch endpoint unavailable; replay individually and stop batching.
+        logger.warning("Batch request to %s/batch failed, falling back", endpoint)
+        self._batch_unsupported.add(endpoint)
+        results = await asyncio.gather(
+            *(
+                self.api._make_request(
+                    endpoint=endpoint,
+                    method="POST",
+                    body=self.api._prepare_body(payload),
+                )
+                for payload in payloads
+            )
+        )
+        for (_, future), result in zip(batch, results):
+            future.set_result(result is not None)
+
+
+class AsyncMegaverseAPI:
+    def __init__(
+        self,
+        base_url: str,
+        candidate_id: str,
+        max_rate: float = 4.0,
+        concurrency: int = 8,
+    ):
+        """Initialize the async Megaverse API client.
+
+        Requests are paced by a rate limiter (max_rate requests per second,
+        kept slightly below the server's advertised limit) and capped by a
+        concurrency semaphore, so wall time scales with N / max_rate instead
+        of N x (RTT + fixed sleep).
+        """
+        self.base_url = base_url.rstrip("/")
+        self.candidate_id = candidate_id
+        self.limiter = AsyncLimiter(max_rate, 1)
+        self.backpressure = Backpressure(initial=float(concurrency))
+        self.client: Optional[httpx.AsyncClient] = None
+        self.batcher = BatchingClient(self)
+        self.retry_quota = RetryQuota()
+        self.retry_controller = RetryController()
+        self._pause_until = 0.0
+        self._goal_map: Optional[List[List[str]]] = None
+
+    async def _wait_if_throttled(self) -> None:
+        """Wait out any reactive pause requested by rate-limit headers."""
+        delay = self._pause_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _note_rate_limits(self, headers) -> None:
+        """Feed rate-limit response headers into the reactive pause."""
+        pause = _rate_limit_pause(headers)
+        if pause:
+            self._pause_until = max(self._pause_until, time.monotonic() + pause)
+
+    async def __aenter__(self) -> "AsyncMegaverseAPI":
+        # HTTP/2 multiplexes all in-flight requests over a few warm
+        # connections instead of opening one TCP connection per request.
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+            timeout=httpx.Timeout(10.0),
+            headers={"Content-Type": "application/json"},
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.client.aclose()
+        self.client = None
+
+    def _prepare_body(self, data: Dict) -> bytes:
+        """Merge candidateId and preserialize the request body once."""
+        return orjson.dumps({**data, "candidateId": self.candidate_id})
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        method: str,
+        body: Optional[bytes] = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        headers: Optional[Dict] = None,
+    ) -> Optional[Dict]:
+        """Make an API request with retry logic.
+
+        Bodies arrive preserialized from _prepare_body, so retries reuse
+        the same immutable bytes instead of re-encoding per attempt.
+        Returns a dict with "status", "etag" and parsed "json" keys on
+        success, or None once retries are exhausted.
+        """
+        url = f"{self.base_url}{endpoint}"
+        req_headers = dict(headers) if headers else {}
+        # Same key on every attempt so the server can dedupe retried POSTs.
+        if body is not None:
+            req_headers["Idempotency-Key"] = _idempotency_key(method, endpoint, body)
+
+        is_probe = False
+        for attempt in range(max_retries):
+            try:
+                async with self.backpressure:
+                    await self._wait_if_throttled()
+                    async with self.limiter:
+                        # Sample after all admission gates so the EWMA sees
+                        # service latency, not time spent queued behind the
+                        # semaphore and rate limiter.
+                        start = time.monotonic()
+                        response = await self.client.request(
+                            method=method,
+                            url=url,
+                            content=body,
+                            headers=req_headers or None,
+                        )
+                        latency = time.monotonic() - start
+            except httpx.HTTPError as e:
+                self.retry_controller.record(False, probe=is_probe)
+                is_probe = False
+                if isinstance(e, httpx.TimeoutException):
+                    self.backpressure.backoff()
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "Request failed (attempt %d/%d): %s",
+                        attempt + 1,
+                        max_retries,
+                        e,
+                    )
+                if attempt < max_retries - 1:
+                    if not self._retry_allowed():
+                        break
+                    is_probe = self.retry_controller.probe_admitted
+                    await asyncio.sleep(random.uniform(0, retry_delay * (2**attempt)))
+                continue
+
+            # Branch on the status code directly; building exceptions and
+            # tracebacks per throttled response is wasted work in the hot
+            # retry loop.
+            self._note_rate_limits(response.headers)
+            if response.status_code < 400:
+                self.backpressure.record(latency)
+                self.retry_controller.record(True, probe=is_probe)
+                if attempt == 0:
+                    self.retry_quota.refund()
+                payload = None
+                content_type = response.headers.get("Content-Type", "")
+                if response.status_code != 304 and content_type.startswith(
+                    "application/json"
+                ):
+                    payload = response.json()
+                return {
+                    "status": response.status_code,
+                    "etag": response.headers.get("ETag"),
+                    "json": payload,
+                }
+
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Request returned %d (attempt %d/%d)",
+                    response.status_code,
+                    attempt + 1,
+                    max_retries,
+                )
+            if response.status_code != 429 and response.status_code < 500:
+                # Expected client error: the server answered, so it resolves
+                # an outstanding probe but must not feed the breaker window.
+                if is_probe:
+                    self.retry_controller.record(True, probe=True)
+                return None
+            self.retry_controller.record(False, probe=is_probe)
+            is_probe = False
+            self.backpressure.backoff()
+            if attempt < max_retries - 1:
+                if not self._retry_allowed():
+                    break
+                is_probe = self.retry_controller.probe_admitted
+                # Full jitter avoids synchronized retry bursts.
+                await asyncio.sleep(random.uniform(0, retry_delay * (2**attempt)))
+
+        return None
+
+    def _retry_allowed(self) -> bool:
+        """Check the circuit breaker and retry quota before backing off."""
+        if not self.retry_controller.allow_retry():
+            logger.warning("Retries disabled by circuit breaker")
+            return False
+        if not self.retry_quota.acquire():
+            self.retry_controller.cancel_probe()
+            logger.warning("Retry budget exhausted, failing fast")
+            return False
+        return True
+
+    async def create_object(self, obj: AstralObject) -> bool:
+        return await self.batcher.submit(obj.ENDPOINT, obj.to_api_params())
+
+    async def get_goal_map(self) -> List[List[str]]:
+        """Fetch the goal map, revalidating an ETag-backed disk cache."""
+        if self._goal_map is not None:
+            return self._goal_map
+
+        cache_path = _goal_map_cache_path(self.candidate_id)
+        cached = _load_goal_map_cache(cache_path)
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
+        endpoint = f"/map/{self.candidate_id}/goal"
+        result = await self._make_request(
+            endpoint=endpoint, method="GET", headers=headers
+        )
+        if result is None:
             logger.error("Failed to retrieve goal map.")
             return []
 
+        if result["status"] == 304 and cached:
+            goal = cached.get("goal", [])
+        else:
+            goal = (result["json"] or {}).get("goal", [])
+            _store_goal_map_cache(cache_path, result["etag"], goal)
+
+        self._goal_map = goal
+        return goal
+
 
 class MegaverseCreator:
-    def __init__(self, api: MegaverseAPI):
+    def __init__(self, api: AsyncMegaverseAPI):
         self.api = api
 
     def parse_goal_map(self, goal_map: List[List[str]]) -> List[AstralObject]:
-        """Parse goal map and return a list of AstralObjects with the correct attributes."""
+        """Parse goal map and return a list of AstralObjects with the correct attributes.
+
+        Cell matching is vectorized with NumPy string comparisons, so only
+        matching cells are visited in Python instead of the whole grid.
+        """
         objects = []
-        for row_index, row in enumerate(goal_map):
-            for col_index, cell in enumerate(row):
-                position = Position(row=row_index, column=col_index)
-
-                if cell == "POLYANET":
-                    objects.append(Polyanet(position))
-                elif cell.endswith("SOLOON"):
-                    color = cell.split("_")[0].lower()  # Extract color
-                    objects.append(Soloon(position, color=color))
-                elif cell.endswith("COMETH"):
-                    direction = cell.split("_")[0].lower()  # Extract direction
-                    objects.append(Cometh(position, direction=direction))
+        if not goal_map:
+            return objects
+        grid = np.array(goal_map, dtype=str)
+
+        for row_index, col_index in np.argwhere(grid == "POLYANET"):
+            position = Position(row=int(row_index), column=int(col_index))
+            objects.append(Polyanet(position))
+
+        for row_index, col_index in np.argwhere(np.char.endswith(grid, "SOLOON")):
+            position = Position(row=int(row_index), column=int(col_index))
+            color = grid[row_index, col_index].split("_")[0].lower()  # Extract color
+            objects.append(Soloon(position, color=color))
+
+        for row_index, col_index in np.argwhere(np.char.endswith(grid, "COMETH")):
+            position = Position(row=int(row_index), column=int(col_index))
+            # Extract direction
+            direction = grid[row_index, col_index].split("_")[0].lower()
+            objects.append(Cometh(position, direction=direction))
+
         return objects
 
-    def create_megaverse(self) -> None:
+    async def create_megaverse(self) -> None:
         """Main method to create the megaverse based on the goal map."""
-        goal_map = self.api.get_goal_map()
+        goal_map = await self.api.get_goal_map()
         if not goal_map:
             logger.error("Goal map retrieval failed, cannot proceed.")
             return
 
         objects = self.parse_goal_map(goal_map)
-        for obj in objects:
-            if self.api.create_object(obj):
-                logger.info(f"Created {obj.__class__.__name__} at {obj.position}")
+
+        # Dispatch all creations concurrently; pacing is handled by the
+        # API client's rate limiter and semaphore.
+        results = await asyncio.gather(
+            *(self.api.create_object(obj) for obj in objects)
+        )
+
+        # Per-object successes go to DEBUG; INFO gets periodic progress and
+        # a final summary so the hot loop stays cheap at default verbosity.
+        total = len(objects)
+        created_count = 0
+        for idx, (obj, created) in enumerate(zip(objects, results), start=1):
+            if created:
+                created_count += 1
+                logger.debug("Created %s at %s", obj.__class__.__name__, obj.position)
             else:
                 logger.error(
-                    f"Failed to create {obj.__class__.__name__} at {obj.position}"
+                    "Failed to create %s at %s", obj.__class__.__name__, obj.position
                 )
-            time.sleep(0.5)  # Delay to avoid rate limits
+            if idx % 50 == 0:
+                logger.info("Progress %d/%d", idx, total)
+        logger.info("Created %d/%d astral objects", created_count, total)
+
+
+async def run(api_base_url: str, candidate_id: str) -> None:
+    """Create the megaverse using the async API client."""
+    async with AsyncMegaverseAPI(api_base_url, candidate_id) as api:
+        creator = MegaverseCreator(api)
+
+        logger.info("Starting Crossmint logo creation...")
+        await creator.create_megaverse()
+        logger.info("Crossmint logo creation completed!")
 
 
 def main():
@@ -160,14 +887,7 @@ def main():
         logger.error("CANDIDATE_ID environment variable not set.")
         return
 
-    # Initialize API and Megaverse Creator
-    api = MegaverseAPI(API_BASE_URL, CANDIDATE_ID)
-    creator = MegaverseCreator(api)
-
-    # Create Crossmint logo pattern
-    logger.info("Starting Crossmint logo creation...")
-    creator.create_megaverse()
-    logger.info("Crossmint logo creation completed!")
+    asyncio.run(run(API_BASE_URL, CANDIDATE_ID))
 
 
 if __name__ == "__main__":